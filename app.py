@@ -12,11 +12,28 @@ Usage:
 Author: Roshan Narode
 """
 
+import logging
+import multiprocessing
+import os
+
 from gui import DataExtractorGUI
 from version import APP_VERSION
 
+# Environment variable selecting the console log level (e.g. DEBUG, WARNING)
+LOG_LEVEL_ENV = "DATA_EXTRACTOR_LOG_LEVEL"
+
+def configure_logging():
+    """Send log messages to the console at the level chosen by LOG_LEVEL_ENV."""
+    # getLevelName maps registered level names to their number and returns a
+    # string for anything else, which falls back to INFO
+    level = logging.getLevelName(os.environ.get(LOG_LEVEL_ENV, "INFO").upper())
+    if not isinstance(level, int):
+        level = logging.INFO
+    logging.basicConfig(level=level, format="%(message)s")
+
 def main():
     """Main function to start the Data Extractor application."""
+    configure_logging()
     try:
         print(f"Starting Data Extractor v{APP_VERSION}")
         # Create and run the GUI application
@@ -31,4 +48,6 @@ def main():
         print("- tkinter (should be included with Python)")
 
 if __name__ == "__main__":
+    # Required for worker processes in the PyInstaller executable
+    multiprocessing.freeze_support()
     main() 
\ No newline at end of file
@@ -1,5 +1,6 @@
 import pandas as pd
 import os
+import stat
 
 # Import version from central location
 from version import APP_VERSION
@@ -13,26 +14,38 @@ from navisworks_processor import (
     extract_read_data_from_multiple_files
 )
 
-def resolve_file_paths(entry_value):
+# File extensions accepted when resolving user input
+CSV_EXTENSIONS = (".csv",)
+
+def resolve_file_paths(entry_value, extensions=CSV_EXTENSIONS):
     """
     Convert user input into list of CSV file paths.
     
     Args:
         entry_value: Directory path, single file, or semicolon-separated files
+        extensions: Tuple of accepted file extensions
         
     Returns:
         list: List of CSV file paths
     """
-    if os.path.isdir(entry_value):
+    # One stat call answers both the directory and the single file checks
+    try:
+        mode = os.stat(entry_value).st_mode
+    except (OSError, ValueError):
+        mode = 0
+
+    if stat.S_ISDIR(mode):
         # Directory - get all CSV files
-        return [os.path.join(entry_value, f) 
-                for f in os.listdir(entry_value) 
-                if f.endswith(".csv")]
+        with os.scandir(entry_value) as entries:
+            return [entry.path for entry in entries
+                    if entry.name.endswith(extensions) and entry.is_file()]
     elif ";" in entry_value:
         # Multiple files separated by semicolon
-        return [f.strip() for f in entry_value.split(";") 
-                if os.path.isfile(f.strip())]
-    elif os.path.isfile(entry_value):
+        candidates = [f.strip() for f in entry_value.split(";")]
+        # Stat each distinct path once, even if it is listed repeatedly
+        is_file = {f: os.path.isfile(f) for f in set(candidates) if f.endswith(extensions)}
+        return [f for f in candidates if is_file.get(f)]
+    elif stat.S_ISREG(mode):
         # Single file
         return [entry_value]
     return []
@@ -111,6 +124,7 @@ __all__ = [
     'extract_read_data_with_exchange_time',
     'extract_read_data_from_multiple_files',
     'resolve_file_paths',
+    'CSV_EXTENSIONS',
     'save_summary_to_csv',
     'save_navisworks_separate_csvs',
     'APP_VERSION'
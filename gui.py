@@ -2,16 +2,28 @@ import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 import os
 import sys
-import pandas as pd
-from data_processor import (
-    process_tekla_csv_files,
-    process_rhino_files,
-    process_navisworks_files,
-    resolve_file_paths,
-    save_summary_to_csv,
-    save_navisworks_separate_csvs,
-    APP_VERSION
-)
+import logging
+import queue
+import threading
+from itertools import islice
+
+# Import version from central location; data_processor pulls in pandas
+# and is imported on first use so the window opens without waiting for it
+from version import APP_VERSION
+
+logger = logging.getLogger(__name__)
+
+# Initial and minimum main window size
+WINDOW_WIDTH = 1000
+WINDOW_HEIGHT = 600
+
+# Rows inserted into a table per event-loop turn
+TABLE_BATCH_SIZE = 500
+
+# Column options that differ from the numeric column defaults
+COLUMN_OPTIONS = {
+    "Data/Model": {"anchor": tk.W, "width": 150}
+}
 
 def get_resource_path(relative_path):
     """Get absolute path to resource, works for dev and for PyInstaller"""
@@ -27,6 +39,8 @@ class DataExtractorGUI:
         self.export_df = None  # Store export data separately for Navisworks
         self.read_df = None    # Store read data separately for Navisworks
         self.is_navisworks_dual = False  # Track if we have dual Navisworks tables
+        self.resolved_paths = {}  # File paths of the last run, keyed by its entry text
+        self.about_window = None  # Built on first use, then hidden and reshown
         self.root = tk.Tk()
         self.setup_window()
         self.setup_interface()
@@ -34,9 +48,8 @@ class DataExtractorGUI:
     def setup_window(self):
         """Configure main window properties"""
         self.root.title(f"Data Extractor v{APP_VERSION}")
-        self.root.geometry("1000x600")
         self.root.resizable(True, True)
-        self.root.minsize(1000, 600)
+        self.root.minsize(WINDOW_WIDTH, WINDOW_HEIGHT)
 
         
         # Set icon if available
@@ -56,13 +69,11 @@ class DataExtractorGUI:
             pass  # Continue without icon
 
     def _center_window(self):
-        """Center window on screen"""
-        self.root.update_idletasks()
-        width = self.root.winfo_width()
-        height = self.root.winfo_height()
-        x = (self.root.winfo_screenwidth() // 2) - (width // 2)
-        y = (self.root.winfo_screenheight() // 2) - (height // 2)
-        self.root.geometry(f"{width}x{height}+{x}+{y}")
+        """Size the window and center it on screen"""
+        # The size is fixed up front, so no idle pass is needed to measure it
+        x = (self.root.winfo_screenwidth() // 2) - (WINDOW_WIDTH // 2)
+        y = (self.root.winfo_screenheight() // 2) - (WINDOW_HEIGHT // 2)
+        self.root.geometry(f"{WINDOW_WIDTH}x{WINDOW_HEIGHT}+{x}+{y}")
 
     def _apply_theme(self):
         """Apply visual theme to the application"""
@@ -177,23 +188,38 @@ class DataExtractorGUI:
             title_label.pack(pady=(0, 5))
 
         # Create new table
-        columns = list(df.columns)
-        self.table = ttk.Treeview(self.table_frame, columns=columns, show="headings")
-        
-        # Configure columns
-        for col in columns:
-            self.table.heading(col, text=col)
-            if col == "Data/Model":
-                self.table.column(col, anchor=tk.W, width=150, stretch=True)
-            else:
-                self.table.column(col, anchor=tk.CENTER, width=120, stretch=True)
+        self.table = self._create_table(self.table_frame, df.columns, width=120)
 
         # Add data rows
-        for _, row in df.iterrows():
-            self.table.insert("", tk.END, values=list(row))
+        self._insert_rows(self.table, df)
             
         self.table.pack(fill=tk.BOTH, expand=True)
 
+    def _create_table(self, parent, columns, width, **options):
+        """Create a headings-only table with one configured column per DataFrame column"""
+        columns = list(columns)
+        table = ttk.Treeview(parent, columns=columns, show="headings", **options)
+        for col in columns:
+            table.heading(col, text=col)
+            table.column(col, stretch=True, **COLUMN_OPTIONS.get(col, {"anchor": tk.CENTER, "width": width}))
+        return table
+
+    def _insert_rows(self, table, df):
+        """Insert DataFrame rows into a table, the first batch before it is packed"""
+        self._insert_row_batch(table, df.itertuples(index=False, name=None))
+
+    def _insert_row_batch(self, table, rows):
+        """Insert the next batch of rows and schedule the rest so large tables don't block the window"""
+        if not table.winfo_exists():
+            return  # Table was replaced before all rows were shown
+        insert = table.insert
+        inserted = 0
+        for row in islice(rows, TABLE_BATCH_SIZE):
+            insert("", tk.END, values=row)
+            inserted += 1
+        if inserted == TABLE_BATCH_SIZE:
+            self.root.after(1, self._insert_row_batch, table, rows)
+
     def display_dual_tables(self, export_df, read_df):
         """Display create and read data in separate tables"""
         # Clear existing table
@@ -214,20 +240,10 @@ class DataExtractorGUI:
             export_frame = ttk.LabelFrame(dual_container, text="Create Data", padding=5)
             export_frame.pack(fill=tk.BOTH, expand=True, pady=(0, 5))
             
-            export_columns = list(export_df.columns)
-            export_table = ttk.Treeview(export_frame, columns=export_columns, show="headings", height=8)
-            
-            # Configure create table columns
-            for col in export_columns:
-                export_table.heading(col, text=col)
-                if col == "Data/Model":
-                    export_table.column(col, anchor=tk.W, width=150, stretch=True)
-                else:
-                    export_table.column(col, anchor=tk.CENTER, width=100, stretch=True)
+            export_table = self._create_table(export_frame, export_df.columns, width=100, height=8)
             
             # Add create data rows
-            for _, row in export_df.iterrows():
-                export_table.insert("", tk.END, values=list(row))
+            self._insert_rows(export_table, export_df)
                 
             export_table.pack(fill=tk.BOTH, expand=True)
             
@@ -241,20 +257,10 @@ class DataExtractorGUI:
             read_frame = ttk.LabelFrame(dual_container, text="Read Data", padding=5)
             read_frame.pack(fill=tk.BOTH, expand=True)
             
-            read_columns = list(read_df.columns)
-            read_table = ttk.Treeview(read_frame, columns=read_columns, show="headings", height=8)
-            
-            # Configure read table columns
-            for col in read_columns:
-                read_table.heading(col, text=col)
-                if col == "Data/Model":
-                    read_table.column(col, anchor=tk.W, width=150, stretch=True)
-                else:
-                    read_table.column(col, anchor=tk.CENTER, width=100, stretch=True)
+            read_table = self._create_table(read_frame, read_df.columns, width=100, height=8)
             
             # Add read data rows
-            for _, row in read_df.iterrows():
-                read_table.insert("", tk.END, values=list(row))
+            self._insert_rows(read_table, read_df)
                 
             read_table.pack(fill=tk.BOTH, expand=True)
             
@@ -284,27 +290,72 @@ class DataExtractorGUI:
             messagebox.showerror("Error", "Please select files or folder first!")
             return
 
+        from data_processor import (
+            process_tekla_csv_files,
+            process_rhino_files,
+            process_navisworks_files,
+            resolve_file_paths
+        )
+
         file_paths = resolve_file_paths(entry_value)
         if not file_paths:
             messagebox.showerror("Error", f"No CSV files found: {entry_value}")
             return
+        self.resolved_paths = {entry_value: file_paths}
 
         # Process based on connector type
+        processors = {
+            "Tekla": process_tekla_csv_files,
+            "Rhino": process_rhino_files,
+            "Navisworks": process_navisworks_files
+        }
+        processor = processors.get(connector)
+        if processor is None:
+            messagebox.showwarning("Warning", "Please select a valid connector.")
+            return
+
+        # Keep the window responsive while files are processed
+        self.run_button.config(state="disabled")
+        self._run_in_background(
+            lambda: processor(file_paths),
+            lambda result, error: self._on_processing_done(connector, result, error)
+        )
+
+    def _run_in_background(self, task, on_done):
+        """Run task on a worker thread and pass its result to on_done on the Tk thread"""
+        results = queue.Queue()
+
+        def worker():
+            try:
+                results.put((task(), None))
+            except Exception as e:
+                results.put((None, e))
+
+        threading.Thread(target=worker, daemon=True).start()
+        self._poll_background(results, on_done)
+
+    def _poll_background(self, results, on_done):
+        """Check for a finished background task without blocking the event loop"""
         try:
-            if connector == "Tekla":
-                self.summary_df = process_tekla_csv_files(file_paths)
-                self._handle_processing_result()
-            elif connector == "Rhino":
-                self.summary_df = process_rhino_files(file_paths)
-                self._handle_processing_result()
-            elif connector == "Navisworks":
-                # Navisworks returns tuple (export_df, read_df)
-                result = process_navisworks_files(file_paths)
-                self._handle_navisworks_result(result)
-            else:
-                messagebox.showwarning("Warning", "Please select a valid connector.")
-        except Exception as e:
-            messagebox.showerror("Error", f"Processing failed:\n{str(e)}")
+            result, error = results.get_nowait()
+        except queue.Empty:
+            self.root.after(50, self._poll_background, results, on_done)
+            return
+        on_done(result, error)
+
+    def _on_processing_done(self, connector, result, error):
+        """Handle a finished processing run on the Tk thread"""
+        self.run_button.config(state="normal")
+        if error is not None:
+            messagebox.showerror("Error", f"Processing failed:\n{str(error)}")
+            return
+
+        if connector == "Navisworks":
+            # Navisworks returns tuple (export_df, read_df)
+            self._handle_navisworks_result(result)
+        else:
+            self.summary_df = result
+            self._handle_processing_result()
 
     def _handle_navisworks_result(self, result):
         """Handle Navisworks processing result (tuple of export and read DataFrames)"""
@@ -328,15 +379,12 @@ class DataExtractorGUI:
             self.read_df = read_df
             self.is_navisworks_dual = True
             
-            # For saving purposes, combine the data
-            export_copy = export_df.copy()
-            read_copy = read_df.copy()
-            export_copy['Data_Type'] = 'Export'
-            read_copy['Data_Type'] = 'Read'
-            self.summary_df = pd.concat([export_copy, read_copy], ignore_index=True)
+            # Saving writes export_df and read_df to separate files, so no
+            # combined copy is built; summary_df only marks results as saveable
+            self.summary_df = export_df
             
             self.save_button.config(state="normal")
-            print(f"Navisworks: Displaying separate tables - Create: {len(export_df)} rows, Read: {len(read_df)} rows")
+            logger.info("Navisworks: Displaying separate tables - Create: %d rows, Read: %d rows", len(export_df), len(read_df))
             
         elif has_export_data:
             # Only create data available - show single create table
@@ -347,7 +395,7 @@ class DataExtractorGUI:
             self.save_button.config(state="normal") 
             self.display_table(export_df, "Create Data")
             
-            print(f"Navisworks: Displaying create data - {len(export_df)} rows")
+            logger.info("Navisworks: Displaying create data - %d rows", len(export_df))
             
         elif has_read_data:
             # Only read data available - show single read table
@@ -358,7 +406,7 @@ class DataExtractorGUI:
             self.save_button.config(state="normal")
             self.display_table(read_df, "Read Data")
             
-            print(f"Navisworks: Displaying read data - {len(read_df)} rows")
+            logger.info("Navisworks: Displaying read data - %d rows", len(read_df))
             
         else:
             # No data in either table
@@ -380,45 +428,83 @@ class DataExtractorGUI:
             messagebox.showwarning("No Data", "No summary available to save.")
             return
 
-        file_paths = resolve_file_paths(self.folder_entry.get().strip())
+        from data_processor import (
+            resolve_file_paths,
+            save_summary_to_csv,
+            save_navisworks_separate_csvs
+        )
+
+        # Reuse the paths resolved by the last run unless the entry has changed
+        entry_value = self.folder_entry.get().strip()
+        file_paths = self.resolved_paths.get(entry_value) or resolve_file_paths(entry_value)
         if not file_paths:
             messagebox.showerror("Error", "Invalid file selection!")
             return
 
+        # Write the files on a worker thread
+        self.save_button.config(state="disabled")
         if self.is_navisworks_dual:
             # Save Navisworks data to separate CSV files
-            export_path, read_path = save_navisworks_separate_csvs(self.export_df, self.read_df, file_paths)
-            
-            success_messages = []
-            error_messages = []
-            
-            if export_path:
-                success_messages.append(f"Create data: {export_path}")
-            else:
-                error_messages.append("Failed to save Create CSV!")
-                
-            if read_path:
-                success_messages.append(f"Read data: {read_path}")
-            else:
-                error_messages.append("Failed to save Read CSV!")
-            
-            if success_messages:
-                message = "Navisworks CSV files saved:\n" + "\n".join(success_messages)
-                messagebox.showinfo("Success", message)
-            
-            if error_messages:
-                error_message = "\n".join(error_messages)
-                messagebox.showerror("Error", error_message)
+            export_df, read_df = self.export_df, self.read_df
+            self._run_in_background(
+                lambda: save_navisworks_separate_csvs(export_df, read_df, file_paths),
+                self._on_navisworks_saved
+            )
         else:
             # Standard single CSV save for other connectors
-            output_path = save_summary_to_csv(self.summary_df, file_paths)
-            if output_path:
-                messagebox.showinfo("Success", f"CSV saved to:\n{output_path}")
-            else:
-                messagebox.showerror("Error", "Failed to save CSV file!")
+            summary_df = self.summary_df
+            self._run_in_background(
+                lambda: save_summary_to_csv(summary_df, file_paths),
+                self._on_summary_saved
+            )
+
+    def _on_navisworks_saved(self, result, error):
+        """Report the outcome of saving Navisworks CSV files"""
+        self._restore_save_button()
+        export_path, read_path = result if error is None else (None, None)
+        
+        success_messages = []
+        error_messages = []
+        
+        if export_path:
+            success_messages.append(f"Create data: {export_path}")
+        else:
+            error_messages.append("Failed to save Create CSV!")
+            
+        if read_path:
+            success_messages.append(f"Read data: {read_path}")
+        else:
+            error_messages.append("Failed to save Read CSV!")
+        
+        if success_messages:
+            message = "Navisworks CSV files saved:\n" + "\n".join(success_messages)
+            messagebox.showinfo("Success", message)
+        
+        if error_messages:
+            error_message = "\n".join(error_messages)
+            messagebox.showerror("Error", error_message)
+
+    def _on_summary_saved(self, output_path, error):
+        """Report the outcome of saving the summary CSV file"""
+        self._restore_save_button()
+        if output_path:
+            messagebox.showinfo("Success", f"CSV saved to:\n{output_path}")
+        else:
+            messagebox.showerror("Error", "Failed to save CSV file!")
+
+    def _restore_save_button(self):
+        """Re-enable saving unless a new run has cleared the results"""
+        if self.summary_df is not None:
+            self.save_button.config(state="normal")
 
     def show_about(self):
         """Show application information"""
+        if self.about_window is not None and self.about_window.winfo_exists():
+            self.about_window.deiconify()
+            self.about_window.lift()
+            self.about_window.grab_set()
+            return
+
         about_text = f"""Data Extractor Version {APP_VERSION}
 
 CSV file processing application for 
@@ -432,11 +518,18 @@ Author: Roshan Narode"""
         about_window.resizable(False, False)
         about_window.transient(self.root)
         about_window.grab_set()
+        about_window.protocol("WM_DELETE_WINDOW", self._hide_about)
         
         ttk.Label(about_window, text=about_text, justify="center", 
                  font=("Segoe UI", 10)).pack(pady=30)
         ttk.Button(about_window, text="OK", 
-                  command=about_window.destroy).pack(pady=10)
+                  command=self._hide_about).pack(pady=10)
+        self.about_window = about_window
+
+    def _hide_about(self):
+        """Hide the About dialog so it can be shown again without rebuilding it"""
+        self.about_window.grab_release()
+        self.about_window.withdraw()
 
     def run(self):
         """Start the application"""
@@ -1,6 +1,20 @@
 import pandas as pd
+import csv
+import math
 import os
-import re
+import logging
+import traceback
+
+# Import helpers shared by all processors
+from processor_utils import (
+    CSV_COLUMN_TYPES, 
+    extract_model_name, 
+    find_matching_operation, 
+    total_by_operation, 
+    calculate_elements_per_minute, 
+    map_files_cached, 
+    build_summary_frame
+)
 
 # Operation mappings for Navisworks - focusing on specific data type counters
 CREATE_OPERATIONS = {
@@ -19,26 +33,55 @@ READ_OPERATIONS = {
 CREATE_TIME_OPERATION = "UpdateExchangeAsync:TotalTimeToCreateExchange"
 READ_TIME_OPERATION = "GetLatestExchangeDataAsync:TotalExchangeReadTime"
 
-def extract_model_name(file_name):
-    """Extract model name from CSV filename."""
-    match = re.match(r"metrics_(.*?)_Demo.*\.csv", file_name)
-    return match.group(1) if match else file_name
+# Fallback name fragments matched when the exact time operation is absent
+CREATE_TIME_PARTIAL = "TotalTimeToCreateExchange"
+READ_TIME_PARTIAL = "TotalExchangeReadTime"
+
+# Summary columns and their output types (None lets pandas infer)
+EXPORT_COLUMN_TYPES = {
+    "Data/Model": None,
+    "Mesh_Export": "int64",
+    "Line_Export": "int64",
+    "Point_Export": "int64",
+    "total_elements": "int64",
+    "milliseconds": "int64",
+    "minutes": "float64",
+    "element_per_min": "float64"
+}
+
+READ_COLUMN_TYPES = {
+    "Data/Model": None,
+    "Brep_Read": "int64",
+    "Mesh_Read": "int64",
+    "Primitive_Read": "int64",
+    "total_elements": "int64",
+    "milliseconds": "int64",
+    "minutes": "float64",
+    "element_per_min": "float64"
+}
+
+logger = logging.getLogger(__name__)
 
-def find_matching_operation(operation_name, operation_map):
-    """Find which operation type matches the given operation name."""
-    for key in operation_map:
-        if key in operation_name:
-            return key
-    return None
+# Per-file (export, read) summaries keyed by (path, mtime, size), least recently used first
+SUMMARY_CACHE_SIZE = 512
+_summary_cache = {}
 
-def calculate_elements_per_minute(total_elements, time_minutes):
-    """Calculate processing rate in elements per minute."""
-    return round(total_elements / time_minutes, 2) if time_minutes > 0 else 0
+def find_operation_time(operation_times, operation_name, partial_name):
+    """
+    Return the total time of an operation, or None if it is not present.
+    
+    An exact operation name match wins; otherwise every operation whose
+    name contains partial_name is summed.
+    """
+    if operation_name in operation_times.index:
+        return operation_times[operation_name]
+    partial = operation_times[[partial_name in name for name in operation_times.index]]
+    return partial.sum() if not partial.empty else None
 
 def process_single_file(csv_file):
     """Process a single CSV file and return separate export and read data."""
     try:
-        df = pd.read_csv(csv_file)
+        df = pd.read_csv(csv_file, usecols=list(CSV_COLUMN_TYPES), dtype=CSV_COLUMN_TYPES, memory_map=True)
         model_name = extract_model_name(os.path.basename(csv_file))
         
         # Initialize export summary (Create operations)
@@ -65,42 +108,40 @@ def process_single_file(csv_file):
             "element_per_min": 0
         }
         
-        # Check what timing data is available
-        has_create_data = not df[df['Operation Name'] == CREATE_TIME_OPERATION].empty
-        if not has_create_data:
-            # Try partial match for create data
-            has_create_data = not df[df['Operation Name'].str.contains('TotalTimeToCreateExchange', na=False)].empty
+        # Totals per operation name, from one pass over the rows
+        operation_totals = total_by_operation(df)
+        operation_times = operation_totals["Operation Time in Milliseconds"]
         
-        has_read_data = not df[df['Operation Name'] == READ_TIME_OPERATION].empty
-        if not has_read_data:
-            # Try partial match for read data
-            has_read_data = not df[df['Operation Name'].str.contains('TotalExchangeReadTime', na=False)].empty
+        # Check what timing data is available
+        create_time_ms = find_operation_time(operation_times, CREATE_TIME_OPERATION, CREATE_TIME_PARTIAL)
+        read_time_ms = find_operation_time(operation_times, READ_TIME_OPERATION, READ_TIME_PARTIAL)
         
-        # Process operations and count elements separately for export and read
-        for _, row in df.iterrows():
-            operation_name = row['Operation Name']
-            events_count = row['#Events']
+        # Match each distinct operation name once against both maps and
+        # count elements separately for export and read
+        for operation_name, events_count in operation_totals["#Events"].items():
+            events_count = int(events_count)
             
-            # Debug: Print operation names found
-            print(f"Processing operation: '{operation_name}' with {events_count} events")
+            # Debug: Log operation names found
+            logger.debug("Processing operation: '%s' with %d events", operation_name, events_count)
             
-            # Check for specific export operations (Create operations)
             export_matched_op = find_matching_operation(operation_name, CREATE_OPERATIONS)
+            read_matched_op = find_matching_operation(operation_name, READ_OPERATIONS)
+            
+            # Check for specific export operations (Create operations)
             if export_matched_op:
                 display_name = CREATE_OPERATIONS[export_matched_op]
                 export_summary[display_name] += events_count
-                print(f"  -> Matched CREATE operation: {export_matched_op} -> {display_name}")
+                logger.debug("  -> Matched CREATE operation: %s -> %s", export_matched_op, display_name)
                 
             # Check for specific read operations
-            read_matched_op = find_matching_operation(operation_name, READ_OPERATIONS)
             if read_matched_op:
                 display_name = READ_OPERATIONS[read_matched_op]
                 read_summary[display_name] += events_count
-                print(f"  -> Matched READ operation: {read_matched_op} -> {display_name}")
+                logger.debug("  -> Matched READ operation: %s -> %s", read_matched_op, display_name)
             
             # If no matches found, report it
             if not export_matched_op and not read_matched_op:
-                print(f"  -> NO MATCH found for operation: '{operation_name}'")
+                logger.debug("  -> NO MATCH found for operation: '%s'", operation_name)
         
         # Calculate total elements for export data
         export_summary["total_elements"] = export_summary["Mesh_Export"] + export_summary["Line_Export"] + export_summary["Point_Export"]
@@ -109,34 +150,20 @@ def process_single_file(csv_file):
         read_summary["total_elements"] = read_summary["Brep_Read"] + read_summary["Mesh_Read"] + read_summary["Primitive_Read"]
         
         # Process timing data for Create operations
-        if has_create_data:
-            time_rows = df[df['Operation Name'] == CREATE_TIME_OPERATION]
-            # If no exact match, try partial matches
-            if time_rows.empty:
-                time_rows = df[df['Operation Name'].str.contains('TotalTimeToCreateExchange', na=False)]
-            
-            if not time_rows.empty:
-                timing_ms = time_rows["Operation Time in Milliseconds"].sum()
-                export_summary["milliseconds"] = int(timing_ms)
-                export_summary["minutes"] = round(timing_ms / 60000, 2)
-                export_summary["element_per_min"] = calculate_elements_per_minute(
-                    export_summary["total_elements"], export_summary["minutes"]
-                )
+        if create_time_ms is not None:
+            export_summary["milliseconds"] = int(create_time_ms)
+            export_summary["minutes"] = round(create_time_ms / 60000, 2)
+            export_summary["element_per_min"] = calculate_elements_per_minute(
+                export_summary["total_elements"], export_summary["minutes"]
+            )
         
         # Process timing data for read operations
-        if has_read_data:
-            time_rows = df[df['Operation Name'] == READ_TIME_OPERATION]
-            # If no exact match, try partial matches
-            if time_rows.empty:
-                time_rows = df[df['Operation Name'].str.contains('TotalExchangeReadTime', na=False)]
-            
-            if not time_rows.empty:
-                timing_ms = time_rows["Operation Time in Milliseconds"].sum()
-                read_summary["milliseconds"] = int(timing_ms)
-                read_summary["minutes"] = round(timing_ms / 60000, 2)
-                read_summary["element_per_min"] = calculate_elements_per_minute(
-                    read_summary["total_elements"], read_summary["minutes"]
-                )
+        if read_time_ms is not None:
+            read_summary["milliseconds"] = int(read_time_ms)
+            read_summary["minutes"] = round(read_time_ms / 60000, 2)
+            read_summary["element_per_min"] = calculate_elements_per_minute(
+                read_summary["total_elements"], read_summary["minutes"]
+            )
         
         # Only return summaries that have actual data
         final_export_summary = None
@@ -147,21 +174,28 @@ def process_single_file(csv_file):
             export_summary["Line_Export"] > 0 or 
             export_summary["Point_Export"] > 0):
             final_export_summary = export_summary
-            print(f"Found create data: Mesh={export_summary['Mesh_Export']}, Line={export_summary['Line_Export']}, Point={export_summary['Point_Export']}")
+            logger.debug("Found create data: Mesh=%d, Line=%d, Point=%d",
+                         export_summary["Mesh_Export"], export_summary["Line_Export"], export_summary["Point_Export"])
         
         # Check if read summary has meaningful data (non-zero counts)
         if (read_summary["Brep_Read"] > 0 or 
             read_summary["Mesh_Read"] > 0 or 
             read_summary["Primitive_Read"] > 0):
             final_read_summary = read_summary
-            print(f"Found read data: Brep={read_summary['Brep_Read']}, Mesh={read_summary['Mesh_Read']}, Primitive={read_summary['Primitive_Read']}")
+            logger.debug("Found read data: Brep=%d, Mesh=%d, Primitive=%d",
+                         read_summary["Brep_Read"], read_summary["Mesh_Read"], read_summary["Primitive_Read"])
         
         return final_export_summary, final_read_summary
         
     except Exception as e:
-        print(f"Error processing {csv_file}: {e}")
+        logger.error("Error processing %s: %s", csv_file, e)
         return None, None
 
+def has_summary(result):
+    """Whether a process_single_file result holds any summary worth caching."""
+    export_summary, read_summary = result
+    return export_summary is not None or read_summary is not None
+
 def process_navisworks_files(file_paths, output_callback=None, status_callback=None):
     """
     Process Navisworks CSV files and return separate summary DataFrames for export and read operations.
@@ -182,15 +216,17 @@ def process_navisworks_files(file_paths, output_callback=None, status_callback=N
             output_callback("No valid CSV files found.")
         return None, None
     
-    # Process each file
+    # Process each file, reusing summaries of unchanged files
     export_results = []
     read_results = []
+    summaries = map_files_cached(
+        process_single_file, csv_files, _summary_cache, SUMMARY_CACHE_SIZE, has_summary
+    )
     
-    for csv_file in csv_files:
+    for csv_file, (export_result, read_result) in zip(csv_files, summaries):
         if output_callback:
             output_callback(f"Processing: {os.path.basename(csv_file)}")
         
-        export_result, read_result = process_single_file(csv_file)
         if export_result:
             export_results.append(export_result)
         if read_result:
@@ -201,38 +237,10 @@ def process_navisworks_files(file_paths, output_callback=None, status_callback=N
     read_df = None
     
     if export_results:
-        export_df = pd.DataFrame(export_results)
-        
-        # Ensure proper data types for export columns
-        export_numeric_columns = [
-            'Mesh_Export', 'Line_Export', 'Point_Export',  # Export counters
-            'total_elements', 'milliseconds'    # General counters
-        ]
-        for col in export_numeric_columns:
-            if col in export_df.columns:
-                export_df[col] = export_df[col].fillna(0).astype(int)
-        
-        float_columns = ['minutes', 'element_per_min']
-        for col in float_columns:
-            if col in export_df.columns:
-                export_df[col] = export_df[col].fillna(0.0)
+        export_df = build_summary_frame(export_results, EXPORT_COLUMN_TYPES)
     
     if read_results:
-        read_df = pd.DataFrame(read_results)
-        
-        # Ensure proper data types for read columns
-        read_numeric_columns = [
-            'Brep_Read', 'Mesh_Read', 'Primitive_Read',    # Read counters
-            'total_elements', 'milliseconds'    # General counters
-        ]
-        for col in read_numeric_columns:
-            if col in read_df.columns:
-                read_df[col] = read_df[col].fillna(0).astype(int)
-        
-        float_columns = ['minutes', 'element_per_min']
-        for col in float_columns:
-            if col in read_df.columns:
-                read_df[col] = read_df[col].fillna(0.0)
+        read_df = build_summary_frame(read_results, READ_COLUMN_TYPES)
     
     if status_callback:
         status_callback("Navisworks processing complete")
@@ -288,8 +296,8 @@ def debug_csv_structure(csv_file_path):
         
         # Check for partial matches
         print(f"\nChecking for partial matches:")
-        create_matches = [op for op in unique_operations if "TotalTimeToCreateExchange" in op]
-        read_matches = [op for op in unique_operations if "TotalExchangeReadTime" in op]
+        create_matches = [op for op in unique_operations if CREATE_TIME_PARTIAL in op]
+        read_matches = [op for op in unique_operations if READ_TIME_PARTIAL in op]
         
         print(f"Create Time matches: {create_matches}")
         print(f"Read Time matches: {read_matches}")
@@ -328,6 +336,12 @@ def debug_csv_structure(csv_file_path):
     except Exception as e:
         print(f"Error debugging CSV structure: {e}")
 
+def parse_number(row, index):
+    """Read a numeric CSV cell; blank, missing and NaN cells count as zero."""
+    value = row[index].strip() if index < len(row) else ""
+    number = float(value) if value else 0.0
+    return 0.0 if math.isnan(number) else number
+
 def extract_read_data_with_exchange_time(csv_file_path):
     """
     Extract read data from Navisworks CSV using GetLatestExchangeDataAsync:TotalExchangeReadTime method.
@@ -339,7 +353,6 @@ def extract_read_data_with_exchange_time(csv_file_path):
         dict: Dictionary containing read data with timing information, or None if no data found
     """
     try:
-        df = pd.read_csv(csv_file_path)
         model_name = extract_model_name(os.path.basename(csv_file_path))
         
         # Initialize read data structure
@@ -356,18 +369,40 @@ def extract_read_data_with_exchange_time(csv_file_path):
             "has_exchange_timing_data": False
         }
         
-        # Extract read operation counts
-        for _, row in df.iterrows():
-            operation_name = row['Operation Name']
-            events_count = row['#Events']
+        # Timing rows: exact GetLatestExchangeDataAsync:TotalExchangeReadTime
+        # matches win over any partial 'TotalExchangeReadTime' matches
+        exact_time_ms = partial_time_ms = 0.0
+        has_exact_time = has_partial_time = False
+        
+        # Scan the rows once, without building a DataFrame
+        with open(csv_file_path, newline="", encoding="utf-8-sig") as csv_file:
+            reader = csv.reader(csv_file)
+            header = next(reader)
+            name_index = header.index("Operation Name")
+            events_index = header.index("#Events")
+            time_index = header.index("Operation Time in Milliseconds")
             
-            # Check for read operations
-            if "ReadBrepCount" in operation_name:
-                read_data["brep_read_count"] += events_count
-            elif "ReadMeshCount" in operation_name:
-                read_data["mesh_read_count"] += events_count
-            elif "ReadPrimitiveCount" in operation_name:
-                read_data["primitive_read_count"] += events_count
+            for row in reader:
+                # Skip blank lines and rows without an operation name, as read_csv does
+                if len(row) <= name_index or not row[name_index]:
+                    continue
+                operation_name = row[name_index]
+                
+                # Check for read operations
+                if "ReadBrepCount" in operation_name:
+                    read_data["brep_read_count"] += int(parse_number(row, events_index))
+                elif "ReadMeshCount" in operation_name:
+                    read_data["mesh_read_count"] += int(parse_number(row, events_index))
+                elif "ReadPrimitiveCount" in operation_name:
+                    read_data["primitive_read_count"] += int(parse_number(row, events_index))
+                
+                if READ_TIME_PARTIAL in operation_name:
+                    time_ms = parse_number(row, time_index)
+                    partial_time_ms += time_ms
+                    has_partial_time = True
+                    if operation_name == READ_TIME_OPERATION:
+                        exact_time_ms += time_ms
+                        has_exact_time = True
         
         # Calculate total elements read
         read_data["total_elements_read"] = (
@@ -376,17 +411,8 @@ def extract_read_data_with_exchange_time(csv_file_path):
             read_data["primitive_read_count"]
         )
         
-        # Extract timing data using GetLatestExchangeDataAsync:TotalExchangeReadTime
-        # Try exact match first
-        time_rows = df[df['Operation Name'] == READ_TIME_OPERATION]
-        
-        # If no exact match, try partial matches
-        if time_rows.empty:
-            # Look for any operation containing 'TotalExchangeReadTime'
-            time_rows = df[df['Operation Name'].str.contains('TotalExchangeReadTime', na=False)]
-        
-        if not time_rows.empty:
-            timing_ms = time_rows["Operation Time in Milliseconds"].sum()
+        if has_exact_time or has_partial_time:
+            timing_ms = exact_time_ms if has_exact_time else partial_time_ms
             read_data["exchange_read_time_ms"] = int(timing_ms)
             read_data["exchange_read_time_minutes"] = round(timing_ms / 60000, 2)
             read_data["has_exchange_timing_data"] = True
@@ -416,7 +442,7 @@ def extract_read_data_with_exchange_time_debug(csv_file_path):
         print(f"EXTRACTING READ DATA FROM: {os.path.basename(csv_file_path)}")
         print(f"{'='*60}")
         
-        df = pd.read_csv(csv_file_path)
+        df = pd.read_csv(csv_file_path, usecols=list(CSV_COLUMN_TYPES), dtype=CSV_COLUMN_TYPES, memory_map=True)
         model_name = extract_model_name(os.path.basename(csv_file_path))
         
         print(f"Model name: {model_name}")
@@ -441,7 +467,8 @@ def extract_read_data_with_exchange_time_debug(csv_file_path):
         # Extract read operation counts with debug info
         for _, row in df.iterrows():
             operation_name = row['Operation Name']
-            events_count = row['#Events']
+            # #Events is read as float; blank cells count as zero
+            events_count = 0 if pd.isna(row['#Events']) else int(row['#Events'])
             
             # Check for read operations
             if "ReadBrepCount" in operation_name:
@@ -476,7 +503,7 @@ def extract_read_data_with_exchange_time_debug(csv_file_path):
         if time_rows.empty:
             # Try partial matches
             print("No exact match found, trying partial matches...")
-            partial_matches = df[df['Operation Name'].str.contains('TotalExchangeReadTime', na=False)]
+            partial_matches = df[df['Operation Name'].str.contains(READ_TIME_PARTIAL, na=False)]
             print(f"Partial matches found: {len(partial_matches)}")
             
             if not partial_matches.empty:
@@ -514,7 +541,6 @@ def extract_read_data_with_exchange_time_debug(csv_file_path):
             
     except Exception as e:
         print(f"Error extracting read data from {csv_file_path}: {e}")
-        import traceback
         traceback.print_exc()
         return None
 
@@ -1,6 +1,17 @@
 import pandas as pd
 import os
-import re
+import logging
+
+# Import helpers shared by all processors
+from processor_utils import (
+    CSV_COLUMN_TYPES, 
+    extract_model_name, 
+    find_matching_operation, 
+    total_by_operation, 
+    calculate_elements_per_minute, 
+    map_files, 
+    build_summary_frame
+)
 
 # Operation mappings for different data types in Rhino
 CREATE_OPERATIONS = {
@@ -21,26 +32,24 @@ READ_OPERATIONS = {
 CREATE_TIME_OPERATION = "UpdateExchangeAsync:TotalCreationTime"
 READ_TIME_OPERATION = "TotalExchangeReadTime"
 
-def extract_model_name(file_name):
-    """Extract model name from CSV filename."""
-    match = re.match(r"metrics_(.*?)_Demo.*\.csv", file_name)
-    return match.group(1) if match else file_name
-
-def find_matching_operation(operation_name, operation_map):
-    """Find which operation type matches the given operation name."""
-    for key in operation_map:
-        if key in operation_name:
-            return key
-    return None
+# Summary columns and their output types (None lets pandas infer)
+SUMMARY_COLUMN_TYPES = {
+    "Data/Model": None,
+    "Mesh": "int64",
+    "Brep": "int64",
+    "Primitive": "int64",
+    "total_elements": "int64",
+    "milliseconds": "int64",
+    "minutes": "float64",
+    "element_per_min": "float64"
+}
 
-def calculate_elements_per_minute(total_elements, time_minutes):
-    """Calculate processing rate in elements per minute."""
-    return round(total_elements / time_minutes, 2) if time_minutes > 0 else 0
+logger = logging.getLogger(__name__)
 
 def process_single_file(csv_file):
     """Process a single CSV file and return summary data."""
     try:
-        df = pd.read_csv(csv_file)
+        df = pd.read_csv(csv_file, usecols=list(CSV_COLUMN_TYPES), dtype=CSV_COLUMN_TYPES, memory_map=True)
         model_name = extract_model_name(os.path.basename(csv_file))
         
         # Initialize summary for Rhino data types
@@ -55,9 +64,12 @@ def process_single_file(csv_file):
             "element_per_min": 0
         }
         
+        # Totals per operation name, from one pass over the rows
+        operation_totals = total_by_operation(df)
+        
         # Check what data is available
-        has_create_data = not df[df['Operation Name'] == CREATE_TIME_OPERATION].empty
-        has_read_data = not df[df['Operation Name'] == READ_TIME_OPERATION].empty
+        has_create_data = CREATE_TIME_OPERATION in operation_totals.index
+        has_read_data = READ_TIME_OPERATION in operation_totals.index
         
         # Prefer create data over read data
         if has_create_data:
@@ -69,30 +81,28 @@ def process_single_file(csv_file):
         else:
             return summary  # No timing data available
         
-        # Process operations and count elements
-        for _, row in df.iterrows():
-            matched_op = find_matching_operation(row['Operation Name'], operation_map)
+        # Match each distinct operation name once and add its events
+        for operation_name, events_count in operation_totals["#Events"].items():
+            matched_op = find_matching_operation(operation_name, operation_map)
             if matched_op:
                 display_name = operation_map[matched_op]
-                summary[display_name] += row['#Events']
+                summary[display_name] += int(events_count)
         
         # Calculate total elements
         summary["total_elements"] = summary["Mesh"] + summary["Brep"] + summary["Primitive"]
         
         # Process timing data
-        time_rows = df[df['Operation Name'] == time_operation]
-        if not time_rows.empty:
-            timing_ms = time_rows["Operation Time in Milliseconds"].sum()
-            summary["milliseconds"] = int(timing_ms)
-            summary["minutes"] = round(timing_ms / 60000, 2)
-            summary["element_per_min"] = calculate_elements_per_minute(
-                summary["total_elements"], summary["minutes"]
-            )
+        timing_ms = operation_totals.at[time_operation, "Operation Time in Milliseconds"]
+        summary["milliseconds"] = int(timing_ms)
+        summary["minutes"] = round(timing_ms / 60000, 2)
+        summary["element_per_min"] = calculate_elements_per_minute(
+            summary["total_elements"], summary["minutes"]
+        )
         
         return summary
         
     except Exception as e:
-        print(f"Error processing {csv_file}: {e}")
+        logger.error("Error processing %s: %s", csv_file, e)
         return None
 
 def process_rhino_files(file_paths, output_callback=None, status_callback=None):
@@ -115,13 +125,12 @@ def process_rhino_files(file_paths, output_callback=None, status_callback=None):
             output_callback("No valid CSV files found.")
         return None
     
-    # Process each file
+    # Process each file, across worker processes for larger batches
     results = []
-    for csv_file in csv_files:
+    for csv_file, result in zip(csv_files, map_files(process_single_file, csv_files)):
         if output_callback:
             output_callback(f"Processing: {os.path.basename(csv_file)}")
         
-        result = process_single_file(csv_file)
         if result:
             results.append(result)
     
@@ -131,18 +140,7 @@ def process_rhino_files(file_paths, output_callback=None, status_callback=None):
         return None
     
     # Create summary DataFrame
-    summary_df = pd.DataFrame(results)
-    
-    # Ensure proper data types
-    numeric_columns = ['Mesh', 'Brep', 'Primitive', 'total_elements', 'milliseconds']
-    for col in numeric_columns:
-        if col in summary_df.columns:
-            summary_df[col] = summary_df[col].fillna(0).astype(int)
-    
-    float_columns = ['minutes', 'element_per_min']
-    for col in float_columns:
-        if col in summary_df.columns:
-            summary_df[col] = summary_df[col].fillna(0.0)
+    summary_df = build_summary_frame(results, SUMMARY_COLUMN_TYPES)
     
     if status_callback:
         status_callback("Rhino processing complete")